@@ -118,15 +118,20 @@ def _save_inventory_1_0(project_name, data):
     io.save(document)
 
     print("Updating assets..")
+
+    # Fetch existing assets in a single query,
+    # as opposed to one query per asset.
+    asset_docs = dict(
+        (asset_doc["name"], asset_doc)
+        for asset_doc in io.find({"parent": document["_id"]})
+    )
+
     added = list()
     updated = list()
     missing = list()
     for silo, assets in data.items():
         for asset in assets:
-            asset_doc = io.find_one({
-                "name": asset["name"],
-                "parent": document["_id"]
-            })
+            asset_doc = asset_docs.get(asset["name"])
 
             if asset_doc is None:
                 asset["silo"] = silo
@@ -236,8 +241,9 @@ def load(name):
 
             inventory[silo].append(dict(data, **{"name": asset["name"]}))
 
-            for key, value in project["data"].items():
-                inventory[key] = value
+        # Project data is the same for every asset, apply it once
+        for key, value in project["data"].items():
+            inventory[key] = value
 
     config = dict(
         DEFAULTS["config"],
@@ -436,33 +442,36 @@ def upload(root, overwrite=False):
     except IOError:
         raise IOError("No project.json found.")
 
-    def _upload_recursive(parent, children):
-        for child in children:
-            grandchildren = child.pop("children")
-            child["parent"] = parent
-
-            document = io.find_one({
-                key: child[key]
-                for key in ("parent",
-                            "type",
-                            "name")
-            })
-
-            if document is None:
-                _id = io.insert_one(child).inserted_id
-                print("+ {0[type]}: '{0[name]}'".format(child))
-            elif overwrite:
-                _id = document["_id"]
-                document.update(child)
-                io.save(document)
-                print("~ {0[type]}: '{0[name]}'".format(child))
-            else:
-                _id = document["_id"]
-                print("| {0[type]}: '{0[name]}'..".format(child))
-
-            _upload_recursive(_id, grandchildren)
-
-    _upload_recursive(None, [project])
+    # Walk the hierarchy depth-first with an explicit
+    # stack, as opposed to recursing per document.
+    stack = [(None, project)]
+    while stack:
+        parent, child = stack.pop()
+        grandchildren = child.pop("children")
+        child["parent"] = parent
+
+        document = io.find_one({
+            key: child[key]
+            for key in ("parent",
+                        "type",
+                        "name")
+        })
+
+        if document is None:
+            _id = io.insert_one(child).inserted_id
+            print("+ {0[type]}: '{0[name]}'".format(child))
+        elif overwrite:
+            _id = document["_id"]
+            document.update(child)
+            io.save(document)
+            print("~ {0[type]}: '{0[name]}'".format(child))
+        else:
+            _id = document["_id"]
+            print("| {0[type]}: '{0[name]}'..".format(child))
+
+        # Reversed, such that children are uploaded in order
+        stack.extend((_id, grandchild)
+                     for grandchild in reversed(grandchildren))
 
     print("Successfully uploaded %s" % fname)
 
@@ -23,6 +23,15 @@ def install(collection="assets"):
 
     self._collection = self._client["mindbender"][collection]
 
+    # Documents are almost exclusively queried by parent, type and name,
+    # such as the subsets of an asset or the latest version of a subset.
+    # Creating an index that already exists is a no-op.
+    self._collection.create_index([
+        ("parent", pymongo.ASCENDING),
+        ("type", pymongo.ASCENDING),
+        ("name", pymongo.ASCENDING),
+    ])
+
     # Shorthand
     self.find = self._collection.find
     self.save = self._collection.save
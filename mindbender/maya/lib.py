@@ -1,6 +1,8 @@
 """Standalone helper functions"""
 
 import contextlib
+import collections
+
 from maya import cmds, mel
 from maya.api import OpenMaya as om
 
@@ -49,18 +51,10 @@ def containerise(name,
         ("comment", version["data"].get("comment", ""))
     ]
 
-    for key, value in data:
-
-        if not value:
-            continue
-
-        if isinstance(value, (int, float)):
-            cmds.addAttr(container, longName=key, attributeType="short")
-            cmds.setAttr(container + "." + key, value)
-
-        else:
-            cmds.addAttr(container, longName=key, dataType="string")
-            cmds.setAttr(container + "." + key, value, type="string")
+    # Omit empty values, maintaining the order of attributes
+    imprint(container, collections.OrderedDict(
+        (key, value) for key, value in data if value
+    ))
 
     # Hide in outliner
     cmds.setAttr(container + ".verticesOnlySet", True)
@@ -278,13 +272,16 @@ def maintained_selection():
     try:
         yield
     finally:
-        if previous_selection:
-            cmds.select(previous_selection,
-                        replace=True,
-                        noExpand=True)
-        else:
-            cmds.select(deselect=True,
-                        noExpand=True)
+        # Selecting registers an undo step and triggers
+        # selection callbacks; skip it if nothing changed.
+        if cmds.ls(selection=True) != previous_selection:
+            if previous_selection:
+                cmds.select(previous_selection,
+                            replace=True,
+                            noExpand=True)
+            else:
+                cmds.select(deselect=True,
+                            noExpand=True)
 
 
 def serialise_shaders(nodes):
@@ -405,24 +402,29 @@ def apply_shaders(relationships):
 
     """
 
+    # Look up every ID in a single pass, as
+    # opposed to searching the scene per ID.
+    nodes_by_id = _lsattr_by_value("mbID")
+
     for shader, ids in relationships.items():
         print("Looking for '%s'.." % shader)
         shader = next(iter(cmds.ls(shader)), None)
         assert shader, "Associated shader not part of asset, this is a bug"
 
+        meshes = list()
         for id_ in ids:
             mesh, faces = (id_.rsplit(".", 1) + [""])[:2]
 
             # Find all meshes matching this particular ID
             # Convert IDs to mesh + id, e.g. "nameOfNode.f[1:100]"
-            meshes = list(".".join([mesh, faces])
-                          for mesh in lsattr("mbID", value=mesh))
+            meshes.extend(".".join([mesh, faces])
+                          for mesh in nodes_by_id.get(mesh, list()))
 
-            if not meshes:
-                continue
+        if not meshes:
+            continue
 
-            print("Assigning '%s' to '%s'" % (shader, ", ".join(meshes)))
-            cmds.sets(meshes, forceElement=shader)
+        print("Assigning '%s' to '%s'" % (shader, ", ".join(meshes)))
+        cmds.sets(meshes, forceElement=shader)
 
 
 def lsattr(attr, value=None):
@@ -462,20 +464,82 @@ def lsattrs(attrs):
 
     """
 
+    first_attr = attrs.iterkeys().next()
+
+    matches = set()
+    for fn_node, full_path_names in _iter_attr_nodes(first_attr):
+        for attr in attrs:
+            try:
+                plug = fn_node.findPlug(attr, True)
+                if plug.asString() != attrs[attr]:
+                    break
+            except RuntimeError:
+                break
+        else:
+            matches.update(full_path_names)
+
+    return list(matches)
+
+
+def _lsattr_by_value(attr):
+    """Return nodes with attribute `attr`, grouped by its value
+
+    Equivalent to calling :func:`lsattr` once per value,
+    but in a single pass over the scene.
+
+    Arguments:
+        attr (str): Name of Maya attribute
+
+    Example:
+        >> _lsattr_by_value("id")
+        {"myId": ["myNode"], "myOtherId": ["myOtherNode"]}
+
+    """
+
+    nodes_by_value = dict()
+    for fn_node, full_path_names in _iter_attr_nodes(attr):
+        try:
+            value = fn_node.findPlug(attr, True).asString()
+        except RuntimeError:
+            continue
+
+        if value not in nodes_by_value:
+            nodes_by_value[value] = set()
+
+        nodes_by_value[value].update(full_path_names)
+
+    return dict(
+        (value, list(nodes))
+        for value, nodes in nodes_by_value.items()
+    )
+
+
+def _iter_attr_nodes(attr):
+    """Yield nodes with attribute `attr`, including those in namespaces
+
+    Arguments:
+        attr (str): Name of Maya attribute
+
+    Yields:
+        (fn_node, full_path_names) per node, where `fn_node` is a
+            function set attached to the node and `full_path_names`
+            its full path(s), one per instance of a DAG node. The
+            function set is re-used, and only valid until the next node.
+
+    """
+
     dep_fn = om.MFnDependencyNode()
     dag_fn = om.MFnDagNode()
     selection_list = om.MSelectionList()
 
-    first_attr = attrs.iterkeys().next()
-
     try:
-        selection_list.add("*.{0}".format(first_attr),
+        selection_list.add("*.{0}".format(attr),
                            searchChildNamespaces=True)
-    except RuntimeError, e:
+    except RuntimeError as e:
         if str(e).endswith("Object does not exist"):
-            return []
+            return
+        raise
 
-    matches = set()
     for i in range(selection_list.length()):
         node = selection_list.getDependNode(i)
         if node.hasFn(om.MFn.kDagNode):
@@ -486,14 +550,4 @@ def lsattrs(attrs):
             fn_node = dep_fn.setObject(node)
             full_path_names = [fn_node.name()]
 
-        for attr in attrs:
-            try:
-                plug = fn_node.findPlug(attr, True)
-                if plug.asString() != attrs[attr]:
-                    break
-            except RuntimeError:
-                break
-        else:
-            matches.update(full_path_names)
-
-    return list(matches)
+        yield fn_node, full_path_names
@@ -7,12 +7,62 @@ from maya import cmds, OpenMaya
 
 from . import lib
 from .. import api, io
-from ..vendor.Qt import QtCore, QtWidgets
+from ..vendor.Qt import QtCore
 
 self = sys.modules[__name__]
 self._menu = "mindbenderCore"
 self._id_callback = None
 
+# Default Instance data
+# All newly created instances will be imbued with these members.
+self._data = (
+    ("id", "pyblish.mindbender.instance"),
+    ("subset", "{name}"),
+    ("family", "{family}"),
+)
+
+# These file-types will appear in the Loader GUI
+self._formats = (
+    ".ma",
+    ".mb",
+    ".abc",
+)
+
+# These families will appear in the Creator GUI
+self._families = (
+    {
+        "name": "mindbender.model",
+        "label": "Model",
+        "help": "Polygonal geometry for animation",
+    },
+    {
+        "name": "mindbender.rig",
+        "label": "Rig",
+        "help": "Character rig",
+    },
+    {
+        "name": "mindbender.lookdev",
+        "label": "Look",
+        "help": "Shaders, textures and look",
+    },
+    {
+        "name": "mindbender.historyLookdev",
+        "label": "History Look",
+        "help": "Shaders, textures and look with History",
+    },
+    {
+        "name": "mindbender.animation",
+        "label": "Animation",
+        "help": "Any character or prop animation",
+        "data": {
+            "startFrame": lambda: cmds.playbackOptions(
+                query=True, animationStartTime=True),
+            "endFrame": lambda: cmds.playbackOptions(
+                query=True, animationEndTime=True),
+        }
+    },
+)
+
 
 def install():
     """Install Maya-specific functionality of mindbender-core.
@@ -42,32 +92,30 @@ def install():
 def uninstall():
     _uninstall_menu()
 
-    api.deregister_format(".ma")
-    api.deregister_format(".mb")
-    api.deregister_format(".abc")
+    for format in self._formats:
+        api.deregister_format(format)
 
-    api.deregister_data("id")
-    api.deregister_data("subset")
-    api.deregister_data("family")
+    for key, _ in self._data:
+        api.deregister_data(key)
 
-    api.deregister_family("mindbender.model")
-    api.deregister_family("mindbender.rig")
-    api.deregister_family("mindbender.animation")
-    api.deregister_family("mindbender.lookdev")
+    for family in self._families:
+        api.deregister_family(family["name"])
 
 
 def _install_menu():
-    from ..tools import (
-        creator,
-        loader,
-        manager
-    )
-
-    from . import interactive
-
     _uninstall_menu()
 
     def deferred():
+        # Importing the tools pulls in Qt and the database client,
+        # leave that until Maya is idle rather than blocking install()
+        from ..tools import (
+            creator,
+            loader,
+            manager
+        )
+
+        from . import interactive
+
         cmds.menu(self._menu,
                   label="Mindbender",
                   tearOff=True,
@@ -121,67 +169,25 @@ def _install_menu():
 
 
 def _uninstall_menu():
-    app = QtWidgets.QApplication.instance()
-    widgets = dict((w.objectName(), w) for w in app.allWidgets())
-    menu = widgets.get(self._menu)
-
-    if menu:
-        menu.deleteLater()
-        del(menu)
+    # Look the menu up by name, rather than
+    # searching through every widget in Maya.
+    if cmds.menu(self._menu, exists=True):
+        cmds.deleteUI(self._menu, menu=True)
 
 
 def _register_data():
-    # Default Instance data
-    # All newly created instances will be imbued with these members.
-    api.register_data(key="id", value="pyblish.mindbender.instance")
-    api.register_data(key="subset", value="{name}")
-    api.register_data(key="family", value="{family}")
+    for key, value in self._data:
+        api.register_data(key=key, value=value)
 
 
 def _register_formats():
-    # These file-types will appear in the Loader GUI
-    api.register_format(".ma")
-    api.register_format(".mb")
-    api.register_format(".abc")
+    for format in self._formats:
+        api.register_format(format)
 
 
 def _register_families():
-    # These families will appear in the Creator GUI
-    api.register_family(
-        name="mindbender.model",
-        label="Model",
-        help="Polygonal geometry for animation",
-    )
-
-    api.register_family(
-        name="mindbender.rig",
-        label="Rig",
-        help="Character rig",
-    )
-
-    api.register_family(
-        name="mindbender.lookdev",
-        label="Look",
-        help="Shaders, textures and look",
-    )
-
-    api.register_family(
-        name="mindbender.historyLookdev",
-        label="History Look",
-        help="Shaders, textures and look with History",
-    )
-
-    api.register_family(
-        name="mindbender.animation",
-        label="Animation",
-        help="Any character or prop animation",
-        data={
-            "startFrame": lambda: cmds.playbackOptions(
-                query=True, animationStartTime=True),
-            "endFrame": lambda: cmds.playbackOptions(
-                query=True, animationEndTime=True),
-        }
-    )
+    for family in self._families:
+        api.register_family(**family)
 
 
 def _register_plugins():
@@ -208,11 +214,12 @@ def ls():
     """
 
     for container in sorted(lib.lsattr("id", "pyblish.mindbender.container")):
-        data = dict(
-            schema="mindbender-core:container-1.0",
-            objectName=container,
-            **lib.read(container)
-        )
+        # Amend the freshly read dictionary, rather than copying it
+        data = lib.read(container)
+        data.update({
+            "schema": "mindbender-core:container-1.0",
+            "objectName": container,
+        })
 
         # api.schema.validate(data, "container")
 
@@ -460,9 +467,22 @@ def _set_uuid(node):
 
 
 def _callback(_):
-    nodes = (set(cmds.ls(type="mesh", long=True)) -
-             set(cmds.ls(long=True, readOnly=True)) -
-             set(cmds.ls(long=True, lockedNodes=True)))
+    meshes = cmds.ls(type="mesh", long=True)
+
+    # Called on every save; bail out early when there is nothing to do.
+    # An empty list would also have the queries below operate
+    # on the entire scene, or current selection, instead.
+    if not meshes:
+        return
+
+    # Only query read-only and locked state of meshes,
+    # as opposed to every node in the scene.
+    nodes = (set(meshes) -
+             set(cmds.ls(meshes, long=True, readOnly=True)) -
+             set(cmds.ls(meshes, long=True, lockedNodes=True)))
+
+    if not nodes:
+        return
 
     transforms = cmds.listRelatives(list(nodes), parent=True) or list()
 
@@ -5,3 +5,23 @@ from mindbender.maya import pipeline, lib
 from nose.tools import (
     assert_equals,
 )
+
+
+def test_lsattr_by_value():
+    """Nodes are grouped by the value of their attribute"""
+
+    cmds.file(new=True, force=True)
+
+    node_a = cmds.createNode("transform", name="nodeA")
+    node_b = cmds.createNode("transform", name="nodeB")
+    node_c = cmds.createNode("transform", name="nodeC")
+
+    lib.imprint(node_a, {"mbID": "first"})
+    lib.imprint(node_b, {"mbID": "second"})
+    lib.imprint(node_c, {"mbID": "first"})
+
+    nodes_by_value = lib._lsattr_by_value("mbID")
+
+    assert_equals(sorted(nodes_by_value), ["first", "second"])
+    assert_equals(sorted(nodes_by_value["first"]), ["|nodeA", "|nodeC"])
+    assert_equals(nodes_by_value["second"], ["|nodeB"])
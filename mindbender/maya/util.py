@@ -29,13 +29,16 @@ def maintained_selection():
     try:
         yield
     finally:
-        if previous_selection:
-            cmds.select(previous_selection,
-                        replace=True,
-                        noExpand=True)
-        else:
-            cmds.select(deselect=True,
-                        noExpand=True)
+        # Selecting registers an undo step and triggers
+        # selection callbacks; skip it if nothing changed.
+        if cmds.ls(selection=True) != previous_selection:
+            if previous_selection:
+                cmds.select(previous_selection,
+                            replace=True,
+                            noExpand=True)
+            else:
+                cmds.select(deselect=True,
+                            noExpand=True)
 
 
 def _maintained_selection(func):
@@ -56,13 +59,14 @@ def _maintained_selection(func):
         try:
             return func(*args, **kwargs)
         finally:
-            if previous_selection:
-                cmds.select(previous_selection,
-                            replace=True,
-                            noExpand=True)
-            else:
-                cmds.select(deselect=True,
-                            noExpand=True)
+            if cmds.ls(selection=True) != previous_selection:
+                if previous_selection:
+                    cmds.select(previous_selection,
+                                replace=True,
+                                noExpand=True)
+                else:
+                    cmds.select(deselect=True,
+                                noExpand=True)
 
     return wrapper
 
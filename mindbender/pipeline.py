@@ -25,6 +25,7 @@ self = sys.modules[__name__]
 
 self.log = logging.getLogger("mindbender-core")
 self._is_installed = False
+self._loader_modules = dict()  # Absolute path -> (mtime, module)
 
 
 def install(host):
@@ -105,21 +106,30 @@ def discover_loaders():
             if not mod_ext == ".py":
                 continue
 
-            module = types.ModuleType(mod_name)
-            module.__file__ = abspath
+            # Loaders are discovered on every load, only
+            # execute those that have changed since last time.
+            mtime = os.path.getmtime(abspath)
+            cached_mtime, module = self._loader_modules.get(
+                abspath, (None, None))
 
-            try:
-                with open(abspath) as f:
-                    six.exec_(f.read(), module.__dict__)
+            if mtime != cached_mtime:
+                module = types.ModuleType(mod_name)
+                module.__file__ = abspath
 
-                # Store reference to original module, to avoid
-                # garbage collection from collecting it's global
-                # imports, such as `import os`.
-                sys.modules[mod_name] = module
+                try:
+                    with open(abspath) as f:
+                        six.exec_(f.read(), module.__dict__)
 
-            except Exception as err:
-                print("Skipped: \"%s\" (%s)", mod_name, err)
-                continue
+                    # Store reference to original module, to avoid
+                    # garbage collection from collecting it's global
+                    # imports, such as `import os`.
+                    sys.modules[mod_name] = module
+
+                except Exception as err:
+                    print("Skipped: \"%s\" (%s)", mod_name, err)
+                    continue
+
+                self._loader_modules[abspath] = (mtime, module)
 
             for plugin in loaders_from_module(module):
                 if plugin.__name__ in loaders:
@@ -77,3 +77,43 @@ class DemoLoader(api.Loader):
 
     finally:
         shutil.rmtree(tempdir)
+
+
+@with_setup(clear)
+def test_loaders_cached():
+    """Unchanged loaders are only executed once"""
+
+    tempdir = tempfile.mkdtemp()
+    fname = os.path.join(tempdir, "my_cached_loader.py")
+
+    loader = """
+from mindbender import api
+
+class CachedLoader(api.Loader):
+    families = %r
+
+"""
+
+    with open(fname, "w") as f:
+        f.write(loader % ["first"])
+
+    try:
+        pipeline.register_loader_path(tempdir)
+
+        first, = pipeline.discover_loaders()
+        second, = pipeline.discover_loaders()
+        assert first is second, "Unchanged loader was re-executed"
+
+        with open(fname, "w") as f:
+            f.write(loader % ["second"])
+
+        # Ensure modification is detected, regardless
+        # of the resolution of the file system timestamp.
+        mtime = os.path.getmtime(fname) + 10
+        os.utime(fname, (mtime, mtime))
+
+        third, = pipeline.discover_loaders()
+        assert_equals(third.families, ["second"])
+
+    finally:
+        shutil.rmtree(tempdir)
@@ -133,7 +133,12 @@ class Window(QtWidgets.QDialog):
         """Load assets from disk and add them to a QListView"""
 
         assets_model = self.data["model"]["assets"]
+
+        # Current item is set once populated, below, avoid
+        # also triggering a change in response to clearing.
+        assets_model.blockSignals(True)
         assets_model.clear()
+        assets_model.blockSignals(False)
 
         has = {"children": False}
 
@@ -337,8 +342,9 @@ class Window(QtWidgets.QDialog):
                 self.echo("Program error: %s" % str(e))
                 raise
 
-            if self.data["button"]["autoclose"].checkState():
-                self.close()
+        # Close once every representation has been loaded
+        if self.data["button"]["autoclose"].checkState():
+            self.close()
 
     def echo(self, message):
         widget = self.data["label"]["message"]